@@ -7,236 +7,381 @@ This version implements:
 - Multiple search algorithms (Uniform Cost Search, A* with various heuristics)
 - Heuristic functions (Misplaced Tile, Manhattan Distance, Euclidean Distance)
 - Solvability checking
+- Boards packed into a single int (4 bits per tile) as the search state
 """
 
 import heapq
 import math
-from copy import deepcopy
+
+
+def encode(state):
+    """
+    Pack a board into a single int, 4 bits per tile.
+    Accepts a 3x3 board or a flat sequence of 9 tiles in row-major order;
+    cell (i, j) lives in the nibble at bit offset 4 * (3*i + j).
+    Already-encoded states are returned unchanged.
+    """
+    if isinstance(state, int):
+        return state
+    if len(state) == 3:
+        state = [tile for row in state for tile in row]
+    packed = 0
+    for k, tile in enumerate(state):
+        packed |= tile << (4 * k)
+    return packed
+
+
+def decode(state):
+    """Unpack an encoded state back into a 3x3 list of lists."""
+    return [[(state >> (4 * (3 * i + j))) & 0xF for j in range(3)] for i in range(3)]
+
+
+# Goal board, and its encoded form that goal_test() compares against
+GOAL_STATE = ((1, 2, 3), (4, 5, 6), (7, 8, 0))
+GOAL_INT = encode(GOAL_STATE)
+
+# Change in blank index for each operator
+DELTA = {"up": -3, "down": 3, "left": -1, "right": 1}
+
+# Indices the blank can swap with from each position, in up/down/left/right order
+NEIGHBORS = (
+    (3, 1), (4, 0, 2), (5, 1),
+    (0, 6, 4), (1, 7, 3, 5), (2, 8, 4),
+    (3, 7), (4, 6, 8), (5, 7),
+)
+
+
+def _manhattan_cells(a, b):
+    """Grid distance between cell indices a and b."""
+    return abs(a // 3 - b // 3) + abs(a % 3 - b % 3)
+
+
+def _euclidean_cells(a, b):
+    """Straight-line distance between cell indices a and b."""
+    return math.hypot(a // 3 - b // 3, a % 3 - b % 3)
+
+
+def _misplaced_cells(a, b):
+    """1 if cell indices a and b differ, else 0."""
+    return 0 if a == b else 1
+
+
+def tile_cost_table(cell_cost, target=GOAL_INT):
+    """
+    Build a table where [pos][tile] is cell_cost(pos, cell of tile in target),
+    and 0 for the blank. Summing it over a board gives a heuristic toward target.
+    """
+    home = [0] * 9
+    for k in range(9):
+        home[(target >> (4 * k)) & 0xF] = k
+    return tuple(
+        tuple(cell_cost(pos, home[tile]) if tile else 0 for tile in range(9))
+        for pos in range(9)
+    )
+
+
+# [pos][tile] cost of `tile` sitting at index `pos`, relative to the goal
+MANHATTAN_COST = tile_cost_table(_manhattan_cells)
+EUCLIDEAN_COST = tile_cost_table(_euclidean_cells)
+MISPLACED_COST = tile_cost_table(_misplaced_cells)
+
+# Operator name for each (old blank, new blank) pair
+MOVE_LABELS = {
+    (blank, blank + delta): operator
+    for blank in range(9)
+    for operator, delta in DELTA.items()
+    if blank + delta in NEIGHBORS[blank]
+}
+
+# (operator, new blank) for every legal move from each blank position
+MOVES = tuple(
+    tuple((MOVE_LABELS[(blank, target)], target) for target in NEIGHBORS[blank])
+    for blank in range(9)
+)
+MOVE_TARGETS = tuple(dict(moves) for moves in MOVES)
+
+
+def is_solvable(state):
+    """
+    Check if a puzzle (3x3 board or encoded int) is solvable.
+    A puzzle is solvable if the number of inversions is even.
+    """
+    state = encode(state)
+    
+    # Single pass: bit t of `seen` is set once tile t has been read, so the
+    # tiles already seen that are larger than the current one form an inversion
+    inversions = 0
+    seen = 0
+    for k in range(9):
+        tile = (state >> (4 * k)) & 0xF
+        if tile != 0:
+            inversions += (seen >> tile).bit_count()
+            seen |= 1 << tile
+    
+    return inversions % 2 == 0
 
 
 class Node:
     """Represents a node in the search tree."""
     
-    def __init__(self, state, parent=None, operator=None, depth=0, path_cost=0, heuristic_cost=0):
+    __slots__ = ('state', 'blank', 'parent', '_operator', 'depth', 'path_cost', 'heuristic_cost', 'f')
+    
+    def __init__(self, state, parent=None, operator=None, depth=0, path_cost=0, heuristic_cost=0, blank=None):
         self.state = state
+        self.blank = blank  # Index (0-8) of the blank, cached to avoid rescanning
         self.parent = parent
-        self.operator = operator
-        self.action = operator  # Alias for compatibility
+        self._operator = operator
         self.depth = depth
         self.path_cost = path_cost
         self.heuristic_cost = heuristic_cost
-    
-    def __lt__(self, other):
-        """Compare nodes based on f value for priority queue."""
-        return self.f < other.f
-    
-    @property
-    def g(self):
-        """Return the cost from start to this node."""
-        return self.depth
+        self.f = depth + heuristic_cost  # Evaluation function f(n) = g(n) + h(n)
     
     @property
-    def h(self):
-        """Return the heuristic cost."""
-        return self.heuristic_cost
-    
-    @property
-    def f(self):
-        """Return the evaluation function f(n) = g(n) + h(n)."""
-        return self.g + self.h
+    def operator(self):
+        """Return the move that produced this node, derived from the blank positions if not given."""
+        if self._operator is None and self.parent is not None:
+            self._operator = MOVE_LABELS[(self.parent.blank, self.blank)]
+        return self._operator
+    
+    # Aliases kept for compatibility
+    action = operator
+    g = property(lambda self: self.depth, doc="Return the cost from start to this node.")
+    h = property(lambda self: self.heuristic_cost, doc="Return the heuristic cost.")
 
 
 class Problem:
-    """Defines the 8-Puzzle problem."""
+    """
+    Defines the 8-Puzzle problem.
+    States are boards packed into an int by encode().
+    """
     
     def __init__(self, initial_state):
-        self.initial_state = initial_state
-        self.goal_state = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+        self.initial_state = encode(initial_state)
+        self.goal_state = GOAL_INT
     
-    def operators(self, state):
+    def operators(self, state, blank=None):
         """Return list of valid operators for the current state."""
-        ops = []
-        blank_row, blank_col = self._find_blank(state)
-        
-        if blank_row > 0:
-            ops.append("up")
-        if blank_row < 2:
-            ops.append("down")
-        if blank_col > 0:
-            ops.append("left")
-        if blank_col < 2:
-            ops.append("right")
-        
-        return ops
+        if blank is None:
+            blank = self._find_blank(state)
+        return [operator for operator, _ in MOVES[blank]]
     
-    def result(self, state, operator):
+    def result(self, state, operator, blank=None):
         """Return the state that results from applying the operator."""
-        new_state = deepcopy(state)
-        blank_row, blank_col = self._find_blank(state)
-        
-        # Determine new position of blank
-        if operator == "up":
-            new_row, new_col = blank_row - 1, blank_col
-        elif operator == "down":
-            new_row, new_col = blank_row + 1, blank_col
-        elif operator == "left":
-            new_row, new_col = blank_row, blank_col - 1
-        elif operator == "right":
-            new_row, new_col = blank_row, blank_col + 1
-        else:
-            return new_state
+        if blank is None:
+            blank = self._find_blank(state)
+        target = MOVE_TARGETS[blank].get(operator)
+        if target is None:
+            return state
         
-        # Swap blank with tile
-        new_state[blank_row][blank_col] = new_state[new_row][new_col]
-        new_state[new_row][new_col] = 0
-        
-        return new_state
+        # Move the tile at the target cell into the blank's nibble
+        tile = (state >> (4 * target)) & 0xF
+        return (state & ~(0xF << (4 * target))) | (tile << (4 * blank))
+    
+    def successors(self, state, blank):
+        """Yield (child_state, child_blank) for every legal move of the blank."""
+        shift = 4 * blank
+        for target in NEIGHBORS[blank]:
+            tile = (state >> (4 * target)) & 0xF
+            yield (state & ~(0xF << (4 * target))) | (tile << shift), target
     
     def goal_test(self, state):
-        """Check if the state is the goal state."""
+        """Check if the encoded state is the goal state (pass boards through encode() first)."""
         return state == self.goal_state
     
     def is_solvable(self, state):
-        """
-        Check if the puzzle is solvable.
-        A puzzle is solvable if the number of inversions is even.
-        """
-        # Flatten the state, ignoring the blank
-        tiles = []
-        for row in state:
-            for tile in row:
-                if tile != 0:
-                    tiles.append(tile)
-        
-        # Count inversions
-        inversions = 0
-        for i in range(len(tiles)):
-            for j in range(i + 1, len(tiles)):
-                if tiles[i] > tiles[j]:
-                    inversions += 1
-        
-        return inversions % 2 == 0
+        """Check if the puzzle is solvable (see the module-level is_solvable)."""
+        return is_solvable(state)
     
     def _find_blank(self, state):
-        """Find the position of the blank (0) in the state."""
-        for i in range(3):
-            for j in range(3):
-                if state[i][j] == 0:
-                    return i, j
-        return None, None
+        """Find the index (0-8) of the blank (0) in the state."""
+        for k in range(9):
+            if (state >> (4 * k)) & 0xF == 0:
+                return k
+        return None
+
+
+def uniform_cost(state):
+    """Uniform cost heuristic (always returns 0) - equivalent to Dijkstra's algorithm."""
+    return 0
+
+
+def misplaced_tile(state):
+    """
+    Count the number of misplaced tiles (excluding the blank).
+    This is an admissible heuristic because each misplaced tile must be moved at least once.
+    Takes an encoded int state; pass 3x3 boards through encode() first.
+    """
+    t = MISPLACED_COST
+    return (
+        t[0][state & 0xF] + t[1][(state >> 4) & 0xF] + t[2][(state >> 8) & 0xF] +
+        t[3][(state >> 12) & 0xF] + t[4][(state >> 16) & 0xF] + t[5][(state >> 20) & 0xF] +
+        t[6][(state >> 24) & 0xF] + t[7][(state >> 28) & 0xF] + t[8][(state >> 32) & 0xF]
+    )
+
+
+def manhattan_distance(state):
+    """
+    Calculate Manhattan distance for all tiles (excluding the blank).
+    Manhattan distance is the sum of horizontal and vertical distances.
+    This is an admissible and consistent heuristic.
+    Takes an encoded int state; pass 3x3 boards through encode() first.
+    """
+    t = MANHATTAN_COST
+    return (
+        t[0][state & 0xF] + t[1][(state >> 4) & 0xF] + t[2][(state >> 8) & 0xF] +
+        t[3][(state >> 12) & 0xF] + t[4][(state >> 16) & 0xF] + t[5][(state >> 20) & 0xF] +
+        t[6][(state >> 24) & 0xF] + t[7][(state >> 28) & 0xF] + t[8][(state >> 32) & 0xF]
+    )
+
+
+def euclidean_distance(state):
+    """
+    Calculate Euclidean distance for all tiles (excluding the blank).
+    Euclidean distance is the straight-line distance.
+    This is an admissible heuristic.
+    Takes an encoded int state; pass 3x3 boards through encode() first.
+    """
+    t = EUCLIDEAN_COST
+    return (
+        t[0][state & 0xF] + t[1][(state >> 4) & 0xF] + t[2][(state >> 8) & 0xF] +
+        t[3][(state >> 12) & 0xF] + t[4][(state >> 16) & 0xF] + t[5][(state >> 20) & 0xF] +
+        t[6][(state >> 24) & 0xF] + t[7][(state >> 28) & 0xF] + t[8][(state >> 32) & 0xF]
+    )
 
 
 class Heuristic:
-    """Collection of heuristic functions for A* search."""
-    
-    @staticmethod
-    def uniform_cost(state):
-        """Uniform cost heuristic (always returns 0) - equivalent to Dijkstra's algorithm."""
-        return 0
-    
-    @staticmethod
-    def misplaced_tile(state):
-        """
-        Count the number of misplaced tiles (excluding the blank).
-        This is an admissible heuristic because each misplaced tile must be moved at least once.
-        """
-        goal = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
-        count = 0
-        for i in range(3):
-            for j in range(3):
-                if state[i][j] != 0 and state[i][j] != goal[i][j]:
-                    count += 1
-        return count
-    
-    @staticmethod
-    def manhattan_distance(state):
-        """
-        Calculate Manhattan distance for all tiles (excluding the blank).
-        Manhattan distance is the sum of horizontal and vertical distances.
-        This is an admissible and consistent heuristic.
-        """
-        distance = 0
-        for i in range(3):
-            for j in range(3):
-                value = state[i][j]
-                if value != 0:
-                    # Calculate goal position for this value
-                    goal_i = (value - 1) // 3
-                    goal_j = (value - 1) % 3
-                    distance += abs(i - goal_i) + abs(j - goal_j)
-        return distance
-    
-    @staticmethod
-    def euclidean_distance(state):
-        """
-        Calculate Euclidean distance for all tiles (excluding the blank).
-        Euclidean distance is the straight-line distance.
-        This is an admissible heuristic.
-        """
-        distance = 0.0
-        for i in range(3):
-            for j in range(3):
-                value = state[i][j]
-                if value != 0:
-                    # Calculate goal position for this value
-                    goal_i = (value - 1) // 3
-                    goal_j = (value - 1) % 3
-                    distance += math.sqrt((i - goal_i)**2 + (j - goal_j)**2)
-        return distance
-
-
-def graph_search(problem, heuristic_func=None):
+    """
+    Collection of heuristic functions for A* search, as aliases of the
+    module-level functions. Like them, they take encoded int states.
+    """
+    
+    uniform_cost = staticmethod(uniform_cost)
+    misplaced_tile = staticmethod(misplaced_tile)
+    manhattan_distance = staticmethod(manhattan_distance)
+    euclidean_distance = staticmethod(euclidean_distance)
+
+
+# Heuristics that are a sum of per-tile costs; graph_search updates these
+# incrementally from the parent's value instead of re-evaluating the board.
+# Euclidean is left out: float rounding would accumulate along the path and
+# perturb tie-breaking between equal-f nodes.
+HEURISTIC_TABLES = {
+    uniform_cost: tile_cost_table(lambda a, b: 0),
+    misplaced_tile: MISPLACED_COST,
+    manhattan_distance: MANHATTAN_COST,
+}
+
+# Per-cell cost behind each table heuristic, so it can be aimed at any target
+CELL_COSTS = {
+    misplaced_tile: _misplaced_cells,
+    manhattan_distance: _manhattan_cells,
+    euclidean_distance: _euclidean_cells,
+}
+
+
+def _build_solution(trail, index, heuristic_func):
+    """Rebuild the Node chain ending at trail[index] by following parent indices."""
+    path = []
+    while index is not None:
+        state, blank, index = trail[index]
+        path.append((state, blank))
+    path.reverse()
+    
+    node = None
+    for depth, (state, blank) in enumerate(path):
+        node = Node(state, node, None, depth, depth, heuristic_func(state), blank)
+    return node
+
+
+def graph_search(problem, heuristic_func=None, use_numba=False, use_cython=False):
     """
     A* graph search algorithm with support for different heuristics.
     If no heuristic is provided, defaults to uniform cost search.
+    With use_numba=True the search runs in the compiled eight_puzzle_nb
+    backend instead (requires numba), and with use_cython=True in the
+    eight_puzzle_core C extension (build it with cythonize first).
+    
+    Frontier entries are plain tuples; parent_index in each points into a
+    trail of expanded nodes, and Node objects are only built for the
+    solution path. The frontier is a binary heap popped in (f, -g, state)
+    order: ties on f go to the deeper entry, then to the smaller encoded
+    state. The compiled backends use the same order, so every path reports
+    the same counts.
+    
+    best_g records the cheapest known g for every generated state. A child
+    is only pushed when it improves on that, and popped entries whose g is
+    no longer the best are stale and skipped.
+    
+    All of this state is local to the call. problem is only read, so one
+    Problem can be reused for any number of searches.
     
     Returns:
         tuple: (goal_node, nodes_expanded, max_queue_size)
     """
+    if use_numba:
+        from eight_puzzle_nb import numba_graph_search
+        return numba_graph_search(problem, heuristic_func)
+    if use_cython:
+        from eight_puzzle_core import cython_graph_search
+        return cython_graph_search(problem, heuristic_func)
+    
     if heuristic_func is None:
-        heuristic_func = Heuristic.uniform_cost
+        heuristic_func = uniform_cost
     
+    return _heap_graph_search(problem, heuristic_func, HEURISTIC_TABLES.get(heuristic_func))
+
+
+def _heap_graph_search(problem, heuristic_func, table):
+    """
+    graph_search() loop on a binary heap, for any heuristic.
+    Frontier entries are (f, -g, state, blank, h, parent_index): ties on f
+    prefer deeper nodes, and the int state settles any remaining tie, so
+    entries compare without a counter.
+    """
     # Initialize
     h_initial = heuristic_func(problem.initial_state)
-    initial_node = Node(problem.initial_state, None, None, 0, 0, h_initial)
-    frontier = [(initial_node.f, 0, initial_node)]  # (f, counter, node)
-    explored = set()
-    counter = 1
+    blank_initial = problem._find_blank(problem.initial_state)
+    frontier = [(h_initial, 0, problem.initial_state, blank_initial, h_initial, None)]
+    trail = []  # (state, blank, parent_index) for each expanded node
+    best_g = {problem.initial_state: 0}
     nodes_expanded = 0
     max_queue_size = 1
     
     while frontier:
         # Get node with lowest f value
-        _, _, node = heapq.heappop(frontier)
+        _, neg_g, state, blank, h, parent_index = heapq.heappop(frontier)
+        g = -neg_g
+        
+        # Skip stale entries superseded by a cheaper path
+        if g != best_g[state]:
+            continue
         
         # Goal test
-        if problem.goal_test(node.state):
-            return node, nodes_expanded, max_queue_size
+        if problem.goal_test(state):
+            trail.append((state, blank, parent_index))
+            goal_node = _build_solution(trail, len(trail) - 1, heuristic_func)
+            return goal_node, nodes_expanded, max_queue_size
         
-        # Add to explored set
-        state_tuple = tuple(map(tuple, node.state))
-        if state_tuple in explored:
-            continue
-        explored.add(state_tuple)
+        trail.append((state, blank, parent_index))
+        index = len(trail) - 1
         nodes_expanded += 1
         
-        # Expand node
-        for operator in problem.operators(node.state):
-            child_state = problem.result(node.state, operator)
-            child_state_tuple = tuple(map(tuple, child_state))
-            
-            if child_state_tuple not in explored:
+        # Expand node. Successors are built inline (as in Problem.successors) so a
+        # rejected child costs only its int key, with no generator or tuple
+        child_g = g + 1
+        shift = 4 * blank
+        for child_blank in NEIGHBORS[blank]:
+            tile = (state >> (4 * child_blank)) & 0xF
+            child_state = (state & ~(0xF << (4 * child_blank))) | (tile << shift)
+            if best_g.get(child_state, math.inf) <= child_g:
+                continue
+            best_g[child_state] = child_g
+            if table is None:
                 h_cost = heuristic_func(child_state)
-                child_node = Node(
-                    child_state,
-                    node,
-                    operator,
-                    node.depth + 1,
-                    node.path_cost + 1,
-                    h_cost
-                )
-                heapq.heappush(frontier, (child_node.f, counter, child_node))
-                counter += 1
+            else:
+                # Only the tile that slid from child_blank into blank changes cost
+                h_cost = h + table[blank][tile] - table[child_blank][tile]
+            heapq.heappush(frontier, (child_g + h_cost, -child_g, child_state, child_blank, h_cost, index))
         
         # Update max queue size
         max_queue_size = max(max_queue_size, len(frontier))
@@ -245,12 +390,237 @@ def graph_search(problem, heuristic_func=None):
     return None, nodes_expanded, max_queue_size
 
 
+def idastar(problem, heuristic_func=None):
+    """
+    Iterative deepening A* (IDA*) search.
+    Runs depth-first searches bounded by f = g + h, raising the bound to the
+    smallest f that exceeded it after each pass. Only the current path is
+    kept in memory, with no frontier or explored table, at the cost of
+    re-expanding nodes on every pass. Works best with integer heuristics;
+    with Euclidean distance the bound creeps up in tiny steps.
+    
+    Returns:
+        tuple: (goal_node, nodes_expanded, max_queue_size) where
+        max_queue_size is the deepest the path stack got
+    """
+    if heuristic_func is None:
+        heuristic_func = uniform_cost
+    table = HEURISTIC_TABLES.get(heuristic_func)
+    
+    nodes_expanded = 0
+    max_queue_size = 1
+    
+    # Without a closed set, IDA* would never give up on an unsolvable puzzle
+    root = problem.initial_state
+    if not problem.is_solvable(root):
+        return None, nodes_expanded, max_queue_size
+    
+    root_blank = problem._find_blank(root)
+    root_h = heuristic_func(root)
+    bound = root_h
+    
+    while True:
+        path = [(root, root_blank, root_h)]  # (state, blank, h) from the root down
+        if problem.goal_test(root):
+            break
+        on_path = {root}
+        children = [problem.successors(root, root_blank)]
+        nodes_expanded += 1
+        next_bound = math.inf
+        found = False
+        
+        while children:
+            state, blank, h = path[-1]
+            child_g = len(path)
+            for child_state, child_blank in children[-1]:
+                if child_state in on_path:
+                    continue
+                if table is None:
+                    child_h = heuristic_func(child_state)
+                else:
+                    tile = (state >> (4 * child_blank)) & 0xF
+                    child_h = h + table[blank][tile] - table[child_blank][tile]
+                
+                f = child_g + child_h
+                if f > bound:
+                    if f < next_bound:
+                        next_bound = f
+                    continue
+                
+                path.append((child_state, child_blank, child_h))
+                max_queue_size = max(max_queue_size, len(path))
+                if problem.goal_test(child_state):
+                    found = True
+                    break
+                on_path.add(child_state)
+                children.append(problem.successors(child_state, child_blank))
+                nodes_expanded += 1
+                break
+            else:
+                # Every child tried: backtrack
+                children.pop()
+                path.pop()
+                on_path.discard(state)
+            
+            if found:
+                break
+        
+        if found:
+            break
+        bound = next_bound
+    
+    trail = [(state, blank, i - 1 if i else None) for i, (state, blank, _) in enumerate(path)]
+    goal_node = _build_solution(trail, len(trail) - 1, heuristic_func)
+    return goal_node, nodes_expanded, max_queue_size
+
+
+def _table_heuristic(table):
+    """Return a heuristic function that sums a [pos][tile] cost table over a state."""
+    def heuristic(state):
+        total = 0
+        for k in range(9):
+            total += table[k][(state >> (4 * k)) & 0xF]
+        return total
+    return heuristic
+
+
+def bidirectional_search(problem, heuristic_func=None):
+    """
+    Bidirectional A* search.
+    One A* runs forward from the initial state and another backward from the
+    goal, always expanding the side with the smaller frontier. Whenever a
+    generated state is known to the other side, the joined path is recorded.
+    The search stops once the best joined path costs no more than the larger
+    of the two smallest f values, or than the two smallest frontier g values
+    plus one move (any path not yet joined crosses from one frontier to the
+    other), so the result is still optimal.
+    
+    The backward search needs a heuristic toward the initial state, which is
+    built from CELL_COSTS; other heuristics fall back to h = 0 backward.
+    Table heuristics are updated incrementally, as in graph_search().
+    
+    Returns:
+        tuple: (goal_node, nodes_expanded, max_queue_size) where
+        max_queue_size counts both frontiers
+    """
+    if heuristic_func is None:
+        heuristic_func = uniform_cost
+    start, goal = problem.initial_state, problem.goal_state
+    
+    # Per direction: an incremental cost table, or None to evaluate h_side
+    if heuristic_func in HEURISTIC_TABLES and heuristic_func in CELL_COSTS:
+        cell_cost = CELL_COSTS[heuristic_func]
+        table_forward, h_forward = tile_cost_table(cell_cost, goal), heuristic_func
+        table_backward = tile_cost_table(cell_cost, start)
+        h_backward = _table_heuristic(table_backward)
+    elif heuristic_func in CELL_COSTS:
+        table_forward, h_forward = None, heuristic_func
+        table_backward = None
+        h_backward = _table_heuristic(tile_cost_table(CELL_COSTS[heuristic_func], start))
+    else:
+        table_forward, h_forward = HEURISTIC_TABLES.get(heuristic_func), heuristic_func
+        table_backward, h_backward = HEURISTIC_TABLES[uniform_cost], uniform_cost
+    
+    nodes_expanded = 0
+    max_queue_size = 1
+    
+    # The two searches can only meet if the goal is reachable
+    if not problem.is_solvable(start):
+        return None, nodes_expanded, max_queue_size
+    
+    # Per side: frontier of (f, -g, state, blank, h), best_g, parent links,
+    # cost table, heuristic, the number of frontier entries at each g, and
+    # the side's slot in min_g
+    h_start, h_goal = h_forward(start), h_backward(goal)
+    forward = ([(h_start, 0, start, problem._find_blank(start), h_start)], {start: 0}, {start: None},
+               table_forward, h_forward, [1], 0)
+    backward = ([(h_goal, 0, goal, problem._find_blank(goal), h_goal)], {goal: 0}, {goal: None},
+                table_backward, h_backward, [1], 1)
+    min_g = [0, 0]  # Smallest g with a frontier entry, forward and backward
+    best_cost = 0 if start == goal else math.inf
+    meeting_state = start if start == goal else None
+    
+    while forward[0] and backward[0]:
+        if best_cost <= max(forward[0][0][0], backward[0][0][0], min_g[0] + min_g[1] + 1):
+            break
+        
+        if len(forward[0]) <= len(backward[0]):
+            side, other = forward, backward
+        else:
+            side, other = backward, forward
+        frontier, best_g, parent, table, h_side, g_counts, slot = side
+        other_g = other[1]
+        
+        _, neg_g, state, blank, h = heapq.heappop(frontier)
+        g = -neg_g
+        g_counts[g] -= 1
+        while min_g[slot] < len(g_counts) and not g_counts[min_g[slot]]:
+            min_g[slot] += 1
+        
+        # Skip stale entries superseded by a cheaper path
+        if g != best_g[state]:
+            continue
+        nodes_expanded += 1
+        
+        # Expand node (see _heap_graph_search)
+        child_g = g + 1
+        if child_g == len(g_counts):
+            g_counts.append(0)
+        shift = 4 * blank
+        for child_blank in NEIGHBORS[blank]:
+            tile = (state >> (4 * child_blank)) & 0xF
+            child_state = (state & ~(0xF << (4 * child_blank))) | (tile << shift)
+            if best_g.get(child_state, math.inf) <= child_g:
+                continue
+            best_g[child_state] = child_g
+            parent[child_state] = state
+            
+            if child_state in other_g and child_g + other_g[child_state] < best_cost:
+                best_cost = child_g + other_g[child_state]
+                meeting_state = child_state
+            
+            if table is None:
+                h_cost = h_side(child_state)
+            else:
+                h_cost = h + table[blank][tile] - table[child_blank][tile]
+            heapq.heappush(frontier, (child_g + h_cost, -child_g, child_state, child_blank, h_cost))
+            g_counts[child_g] += 1
+        
+        max_queue_size = max(max_queue_size, len(forward[0]) + len(backward[0]))
+    
+    if meeting_state is None:
+        return None, nodes_expanded, max_queue_size
+    
+    # Stitch start -> meeting state -> goal from the two parent chains
+    states = []
+    state = meeting_state
+    while state is not None:
+        states.append(state)
+        state = forward[2][state]
+    states.reverse()
+    state = backward[2][meeting_state]
+    while state is not None:
+        states.append(state)
+        state = backward[2][state]
+    
+    trail = [(state, problem._find_blank(state), i - 1 if i else None) for i, state in enumerate(states)]
+    goal_node = _build_solution(trail, len(trail) - 1, heuristic_func)
+    return goal_node, nodes_expanded, max_queue_size
+
+
 def uniform_cost_search(problem):
     """
     Uniform Cost Search (Dijkstra) algorithm.
     This is a special case of A* with h(n) = 0.
     """
-    return graph_search(problem, Heuristic.uniform_cost)
+    return graph_search(problem, uniform_cost)
+
+
+def format_state(state):
+    """Return the rows of a puzzle state (3x3 board or encoded int) as strings, blank shown as 'b'."""
+    if isinstance(state, int):
+        state = decode(state)
+    return [" ".join("b" if x == 0 else str(x) for x in row) for row in state]
 
 
 def print_state(label, state):
@@ -259,12 +629,12 @@ def print_state(label, state):
     
     Args:
         label: Optional label to print before the state (can be empty string)
-        state: The puzzle state to print
+        state: The puzzle state to print (3x3 board or encoded int)
     """
     if label:
         print(label)
-    for row in state:
-        print(" ".join("b" if x == 0 else str(x) for x in row))
+    for row in format_state(state):
+        print(row)
 
 
 def print_solution(goal_node):
@@ -303,10 +673,10 @@ def compare_algorithms(initial_state):
         return
     
     algorithms = [
-        ("Uniform Cost Search", Heuristic.uniform_cost),
-        ("Misplaced Tile", Heuristic.misplaced_tile),
-        ("Euclidean Distance", Heuristic.euclidean_distance),
-        ("Manhattan Distance", Heuristic.manhattan_distance),
+        ("Uniform Cost Search", uniform_cost),
+        ("Misplaced Tile", misplaced_tile),
+        ("Euclidean Distance", euclidean_distance),
+        ("Manhattan Distance", manhattan_distance),
     ]
     
     print("\nAlgorithm Comparison:")
@@ -355,7 +725,7 @@ def main():
     print("\n" + "=" * 80)
     print("Detailed Solution using Manhattan Distance Heuristic:")
     print("=" * 80)
-    goal_node, nodes_expanded, max_queue = graph_search(problem, Heuristic.manhattan_distance)
+    goal_node, nodes_expanded, max_queue = graph_search(problem, manhattan_distance)
     
     if goal_node:
         print(f"\nSolution found!")
@@ -368,5 +738,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
-
@@ -0,0 +1,125 @@
+"""
+8-Puzzle Solver - batched NumPy helpers
+CS 170 Project 1
+
+Works on many boards at once, stored as an (N, 9) uint8 array in row-major
+order. Successor generation and the table heuristics become array
+gathers, and solve_depths() finds the optimal depth of a whole batch of
+puzzles in a single breadth-first sweep out from the goal.
+
+Requirements: numpy
+Install: pip install numpy
+"""
+
+import numpy as np
+
+from eight_puzzle import (
+    DELTA, EUCLIDEAN_COST, GOAL_INT, MANHATTAN_COST, MISPLACED_COST, NEIGHBORS, Problem, decode,
+)
+
+# TARGET[blank, d]: index the blank moves to in direction d (up/down/left/right), -1 if off the board
+TARGET = np.full((9, 4), -1, dtype=np.int64)
+for _blank in range(9):
+    for _d, _delta in enumerate(DELTA.values()):
+        if _blank + _delta in NEIGHBORS[_blank]:
+            TARGET[_blank, _d] = _blank + _delta
+
+# The goal cost tables as 9x9 arrays indexed [pos, tile]
+MANHATTAN_TABLE = np.array(MANHATTAN_COST, dtype=np.int64)
+MISPLACED_TABLE = np.array(MISPLACED_COST, dtype=np.int64)
+EUCLIDEAN_TABLE = np.array(EUCLIDEAN_COST, dtype=np.float64)
+
+# Bit offset of each cell in the packed-int encoding
+SHIFTS = 4 * np.arange(9, dtype=np.int64)
+
+
+def to_array(puzzles):
+    """Stack boards (3x3 lists or encoded ints) into an (N, 9) uint8 array."""
+    boards = [decode(p) if isinstance(p, int) else p for p in puzzles]
+    return np.array(boards, dtype=np.uint8).reshape(len(boards), 9)
+
+
+def pack(states):
+    """Encode each row of an (N, 9) array as in eight_puzzle.encode()."""
+    return (states.astype(np.int64) << SHIFTS).sum(axis=1)
+
+
+def expand(states, blanks):
+    """
+    Generate every child of every state.
+    
+    Returns:
+        tuple: (children, child_blanks, parents) where parents[i] is the row
+        of `states` that children[i] came from
+    """
+    rows = np.arange(len(states))
+    children, child_blanks, parents = [], [], []
+    for d in range(4):
+        targets = TARGET[blanks, d]
+        mask = targets >= 0
+        r, b, t = rows[mask], blanks[mask], targets[mask]
+        
+        # Slide the tile at t into the blank at b
+        child = states[r].copy()
+        idx = np.arange(len(r))
+        child[idx, b] = states[r, t]
+        child[idx, t] = 0
+        
+        children.append(child)
+        child_blanks.append(t)
+        parents.append(r)
+    return np.concatenate(children), np.concatenate(child_blanks), np.concatenate(parents)
+
+
+def manhattan(states):
+    """Manhattan distance of each row of an (N, 9) array."""
+    return MANHATTAN_TABLE[np.arange(9), states].sum(axis=1)
+
+
+def misplaced(states):
+    """Misplaced tile count of each row of an (N, 9) array."""
+    return MISPLACED_TABLE[np.arange(9), states].sum(axis=1)
+
+
+def euclidean(states):
+    """Euclidean distance of each row of an (N, 9) array."""
+    return EUCLIDEAN_TABLE[np.arange(9), states].sum(axis=1)
+
+
+def solve_depths(puzzles):
+    """
+    Optimal solution depth of every puzzle, or -1 if it is unsolvable.
+    Runs one breadth-first search out from the goal, one whole layer per
+    step, and stops as soon as every solvable puzzle has been reached.
+    """
+    problem = Problem(GOAL_INT)
+    targets = pack(to_array(puzzles))
+    depths = np.full(len(targets), -1, dtype=np.int64)
+    pending = np.array([problem.is_solvable(int(t)) for t in targets], dtype=bool)
+    
+    frontier = to_array([GOAL_INT])
+    blanks = np.array([8], dtype=np.int64)
+    frontier_keys = pack(frontier)
+    previous_keys = frontier_keys[:0]
+    depth = 0
+    
+    while pending.any() and len(frontier):
+        reached = pending & np.isin(targets, frontier_keys)
+        depths[reached] = depth
+        pending &= ~reached
+        if not pending.any():
+            break
+        
+        # Next layer: unique children not in the previous layer. Every move flips
+        # the blank's checkerboard colour, so a child of layer d can only be in
+        # layer d - 1 or d + 1 and only the previous layer needs checking
+        children, child_blanks, _ = expand(frontier, blanks)
+        keys, first = np.unique(pack(children), return_index=True)
+        new = ~np.isin(keys, previous_keys, assume_unique=True)
+        previous_keys = frontier_keys
+        frontier = children[first[new]]
+        blanks = child_blanks[first[new]]
+        frontier_keys = keys[new]
+        depth += 1
+    
+    return depths
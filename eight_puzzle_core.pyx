@@ -0,0 +1,224 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+8-Puzzle Solver - Cython backend
+CS 170 Project 1
+
+C extension version of the A* loop in eight_puzzle.py, for when Numba's
+compile step is too expensive (many small runs, as in generate_report.py).
+Works on the same packed-int states and pops the frontier in the same
+(f, -g, state) order as graph_search(), so nodes expanded and max queue
+size match the default search.
+
+Requirements: cython and a C compiler
+Build: cythonize -i eight_puzzle_core.pyx
+"""
+
+from libc.stdlib cimport free, malloc, realloc
+
+from eight_puzzle import (
+    EUCLIDEAN_COST, MANHATTAN_COST, MISPLACED_COST, NEIGHBORS, _build_solution,
+    euclidean_distance, manhattan_distance, misplaced_tile, uniform_cost,
+)
+
+# Heuristic ids understood by astar()
+UNIFORM_COST = 0
+MISPLACED_TILE = 1
+MANHATTAN_DISTANCE = 2
+EUCLIDEAN_DISTANCE = 3
+
+HEURISTIC_IDS = {
+    uniform_cost: UNIFORM_COST,
+    misplaced_tile: MISPLACED_TILE,
+    manhattan_distance: MANHATTAN_DISTANCE,
+    euclidean_distance: EUCLIDEAN_DISTANCE,
+}
+
+# [kind][pos][tile] cost tables, all zero for uniform cost
+cdef double TABLES[4][9][9]
+for _pos in range(9):
+    for _tile in range(9):
+        TABLES[UNIFORM_COST][_pos][_tile] = 0.0
+        TABLES[MISPLACED_TILE][_pos][_tile] = MISPLACED_COST[_pos][_tile]
+        TABLES[MANHATTAN_DISTANCE][_pos][_tile] = MANHATTAN_COST[_pos][_tile]
+        TABLES[EUCLIDEAN_DISTANCE][_pos][_tile] = EUCLIDEAN_COST[_pos][_tile]
+
+# NEIGHBORS padded with -1, as in eight_puzzle_nb
+cdef int NEIGHBOR_TABLE[9][4]
+for _blank, _targets in enumerate(NEIGHBORS):
+    for _k in range(4):
+        NEIGHBOR_TABLE[_blank][_k] = _targets[_k] if _k < len(_targets) else -1
+
+
+cdef struct Entry:
+    double f
+    long long neg_g
+    unsigned long long state
+    int blank
+
+
+cdef inline bint _less(Entry *a, Entry *b) noexcept nogil:
+    """Order entries by (f, -g, state), as the tuples in _heap_graph_search()."""
+    if a.f != b.f:
+        return a.f < b.f
+    if a.neg_g != b.neg_g:
+        return a.neg_g < b.neg_g
+    return a.state < b.state
+
+
+cdef void _push(Entry *heap, Py_ssize_t size, Entry entry) noexcept nogil:
+    """Sift `entry` up from slot `size`; the caller grows the heap first."""
+    cdef Py_ssize_t i = size, up
+    while i > 0:
+        up = (i - 1) >> 1
+        if not _less(&entry, &heap[up]):
+            break
+        heap[i] = heap[up]
+        i = up
+    heap[i] = entry
+
+
+cdef Entry _pop(Entry *heap, Py_ssize_t size) noexcept nogil:
+    """Remove and return the smallest of the `size` entries."""
+    cdef Entry top = heap[0]
+    cdef Entry last = heap[size - 1]
+    cdef Py_ssize_t i = 0, child
+    size -= 1
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and _less(&heap[child + 1], &heap[child]):
+            child += 1
+        if not _less(&heap[child], &last):
+            break
+        heap[i] = heap[child]
+        i = child
+    if size > 0:
+        heap[i] = last
+    return top
+
+
+cdef inline double _heuristic(unsigned long long state, int kind) noexcept nogil:
+    """Sum cost table `kind` over the nine cells of an encoded state."""
+    cdef double total = 0.0
+    cdef int k
+    for k in range(9):
+        total += TABLES[kind][k][(state >> (4 * k)) & 0xF]
+    return total
+
+
+cdef int _find_blank(unsigned long long state) noexcept nogil:
+    """Find the index (0-8) of the blank in an encoded state."""
+    cdef int k
+    for k in range(9):
+        if (state >> (4 * k)) & 0xF == 0:
+            return k
+    return -1
+
+
+def astar(unsigned long long initial, unsigned long long goal, int kind):
+    """
+    A* search on encoded states, with the same bookkeeping as graph_search().
+
+    Returns:
+        tuple: (found, nodes_expanded, max_queue_size, path) where path is the
+        list of encoded states from initial to goal (empty if not found)
+    """
+    cdef dict best_g = {initial: 0}
+    cdef dict parent = {initial: None}
+    cdef Py_ssize_t capacity = 1024, size = 1, max_queue_size = 1
+    cdef long nodes_expanded = 0
+    cdef long long g, child_g
+    cdef unsigned long long state, child, tile
+    cdef int blank, target, k
+    cdef Entry entry, child_entry
+    cdef Entry *grown
+    cdef Entry *heap = <Entry *> malloc(capacity * sizeof(Entry))
+    if heap == NULL:
+        raise MemoryError()
+
+    try:
+        heap[0].f = _heuristic(initial, kind)
+        heap[0].neg_g = 0
+        heap[0].state = initial
+        heap[0].blank = _find_blank(initial)
+
+        while size > 0:
+            entry = _pop(heap, size)
+            size -= 1
+            state = entry.state
+            g = -entry.neg_g
+
+            # Skip stale entries superseded by a cheaper path
+            if g != best_g[state]:
+                continue
+
+            if state == goal:
+                path = []
+                current = state
+                while current is not None:
+                    path.append(current)
+                    current = parent[current]
+                path.reverse()
+                return True, nodes_expanded, max_queue_size, path
+            nodes_expanded += 1
+
+            blank = entry.blank
+            child_g = g + 1
+            for k in range(4):
+                target = NEIGHBOR_TABLE[blank][k]
+                if target < 0:
+                    break
+                tile = (state >> (4 * target)) & 0xF
+                child = (state & ~(<unsigned long long> 0xF << (4 * target))) | (tile << (4 * blank))
+                known = best_g.get(child)
+                if known is not None and <long long> known <= child_g:
+                    continue
+                best_g[child] = child_g
+                parent[child] = state
+
+                if size == capacity:
+                    capacity *= 2
+                    grown = <Entry *> realloc(heap, capacity * sizeof(Entry))
+                    if grown == NULL:
+                        raise MemoryError()
+                    heap = grown
+                child_entry.f = child_g + _heuristic(child, kind)
+                child_entry.neg_g = -child_g
+                child_entry.state = child
+                child_entry.blank = target
+                _push(heap, size, child_entry)
+                size += 1
+
+            if size > max_queue_size:
+                max_queue_size = size
+
+        return False, nodes_expanded, max_queue_size, []
+    finally:
+        free(heap)
+
+
+def cython_graph_search(problem, heuristic_func=None):
+    """
+    Drop-in replacement for graph_search() that runs the search in astar().
+    Only the built-in heuristics are supported.
+
+    Returns:
+        tuple: (goal_node, nodes_expanded, max_queue_size)
+    """
+    if heuristic_func is None:
+        heuristic_func = uniform_cost
+    if heuristic_func not in HEURISTIC_IDS:
+        raise ValueError(f"No Cython implementation for heuristic {heuristic_func.__name__}")
+
+    found, nodes_expanded, max_queue_size, path = astar(
+        problem.initial_state, problem.goal_state, HEURISTIC_IDS[heuristic_func]
+    )
+    if not found:
+        return None, nodes_expanded, max_queue_size
+
+    trail = []
+    for i, state in enumerate(path):
+        trail.append((state, problem._find_blank(state), i - 1 if i else None))
+    goal_node = _build_solution(trail, len(trail) - 1, heuristic_func)
+    return goal_node, nodes_expanded, max_queue_size
@@ -0,0 +1,212 @@
+"""
+8-Puzzle Solver - Numba backend
+CS 170 Project 1
+
+Compiled version of graph_search() from eight_puzzle.py. The whole A* loop
+runs under Numba on the same packed-int states, which makes it much faster
+on deep puzzles. The frontier pops in the same (f, -g, state) order as
+graph_search(), so nodes expanded and max queue size match the default
+search. Search bookkeeping lives in flat arrays indexed by each state's
+permutation rank (0 to 9! - 1) instead of hash tables.
+
+Requirements: numba, numpy
+Install: pip install numba
+"""
+
+import heapq
+
+import numpy as np
+from numba import njit
+
+from eight_puzzle import (
+    EUCLIDEAN_COST, GOAL_INT, MANHATTAN_COST, NEIGHBORS, _build_solution,
+    euclidean_distance, manhattan_distance, misplaced_tile, uniform_cost,
+)
+
+# Heuristic ids understood by astar()
+UNIFORM_COST = 0
+MISPLACED_TILE = 1
+MANHATTAN_DISTANCE = 2
+EUCLIDEAN_DISTANCE = 3
+
+HEURISTIC_IDS = {
+    uniform_cost: UNIFORM_COST,
+    misplaced_tile: MISPLACED_TILE,
+    manhattan_distance: MANHATTAN_DISTANCE,
+    euclidean_distance: EUCLIDEAN_DISTANCE,
+}
+
+# NEIGHBORS as a 9x4 array, padded with -1
+NEIGHBOR_TABLE = np.full((9, 4), -1, dtype=np.int64)
+for _blank, _targets in enumerate(NEIGHBORS):
+    NEIGHBOR_TABLE[_blank, :len(_targets)] = _targets
+
+# MANHATTAN_COST as a 9x9 array indexed [pos, tile]
+MANHATTAN_TABLE = np.array(MANHATTAN_COST, dtype=np.int8)
+EUCLIDEAN_TABLE = np.array(EUCLIDEAN_COST, dtype=np.float64)
+
+# Number of permutations of the nine tiles, and the factorial weight of each cell in rank()
+STATE_COUNT = 362880
+FACTORIALS = np.array([40320, 5040, 720, 120, 24, 6, 2, 1, 1], dtype=np.int64)
+
+# came_from marker for the root, and best_g marker for a state not yet generated
+ROOT = 9
+UNSEEN = 255
+
+
+@njit(cache=True)
+def find_blank(state):
+    """Find the index (0-8) of the blank in an encoded state."""
+    for k in range(9):
+        if (state >> (4 * k)) & 0xF == 0:
+            return k
+    return -1
+
+
+@njit(cache=True)
+def heuristic(state, kind):
+    """Evaluate heuristic number `kind` on an encoded state."""
+    if kind == UNIFORM_COST:
+        return 0.0
+    if kind == MANHATTAN_DISTANCE:
+        distance = 0
+        for k in range(9):
+            distance += MANHATTAN_TABLE[k, (state >> (4 * k)) & 0xF]
+        return float(distance)
+    total = 0.0
+    for k in range(9):
+        value = (state >> (4 * k)) & 0xF
+        if kind == MISPLACED_TILE:
+            if value != 0 and value != k + 1:
+                total += 1.0
+        else:
+            total += EUCLIDEAN_TABLE[k, value]
+    return total
+
+
+@njit(cache=True)
+def rank(state):
+    """Lehmer-code index (0 to 9! - 1) of the tile permutation in an encoded state."""
+    index = 0
+    seen = 0
+    for k in range(9):
+        tile = (state >> (4 * k)) & 0xF
+        # Tiles already placed that are smaller than this one
+        below = seen & ((1 << tile) - 1)
+        smaller = 0
+        while below:
+            below &= below - 1
+            smaller += 1
+        index += (tile - smaller) * FACTORIALS[k]
+        seen |= 1 << tile
+    return index
+
+
+@njit(cache=True)
+def _path_to(came_from, state, blank):
+    """
+    Return the states from the root to `state`. came_from holds the blank
+    index of each state's parent, so every step back is a single tile swap.
+    """
+    length = 1
+    current, current_blank = state, blank
+    while came_from[rank(current)] != ROOT:
+        previous = came_from[rank(current)]
+        tile = (current >> (4 * previous)) & 0xF
+        current = (current & ~(0xF << (4 * previous))) | (tile << (4 * current_blank))
+        current_blank = previous
+        length += 1
+    
+    path = np.empty(length, dtype=np.int64)
+    current, current_blank = state, blank
+    for i in range(length - 1, -1, -1):
+        path[i] = current
+        if i:
+            previous = came_from[rank(current)]
+            tile = (current >> (4 * previous)) & 0xF
+            current = (current & ~(0xF << (4 * previous))) | (tile << (4 * current_blank))
+            current_blank = previous
+    return path
+
+
+@njit(cache=True)
+def astar(initial, goal, kind):
+    """
+    A* search on encoded states, with the same bookkeeping as graph_search().
+    The frontier is a heap of (f, -g, state, blank) tuples, as in
+    _heap_graph_search(), so f ties go to deeper nodes. best_g and came_from
+    are byte arrays indexed by rank(); g never exceeds 31 on the 8-puzzle.
+    
+    Returns:
+        tuple: (found, nodes_expanded, max_queue_size, path) where path holds
+        the encoded states from initial to goal (empty if not found)
+    """
+    best_g = np.full(STATE_COUNT, UNSEEN, dtype=np.uint8)
+    came_from = np.empty(STATE_COUNT, dtype=np.uint8)  # Parent's blank index
+    best_g[rank(initial)] = 0
+    came_from[rank(initial)] = ROOT
+    
+    # (f, -g, state, blank)
+    frontier = [(heuristic(initial, kind), np.int64(0), initial, np.int64(find_blank(initial)))]
+    nodes_expanded = 0
+    max_queue_size = 1
+    
+    while len(frontier) > 0:
+        _, neg_g, state, blank = heapq.heappop(frontier)
+        g = -neg_g
+        
+        # Skip stale entries superseded by a cheaper path
+        if g != best_g[rank(state)]:
+            continue
+        
+        if state == goal:
+            return True, nodes_expanded, max_queue_size, _path_to(came_from, state, blank)
+        nodes_expanded += 1
+        
+        child_g = g + 1
+        for k in range(4):
+            target = NEIGHBOR_TABLE[blank, k]
+            if target < 0:
+                break
+            tile = (state >> (4 * target)) & 0xF
+            child = (state & ~(0xF << (4 * target))) | (tile << (4 * blank))
+            child_rank = rank(child)
+            if best_g[child_rank] <= child_g:
+                continue
+            best_g[child_rank] = child_g
+            came_from[child_rank] = blank
+            heapq.heappush(frontier, (child_g + heuristic(child, kind), -child_g, child, target))
+        
+        max_queue_size = max(max_queue_size, len(frontier))
+    
+    return False, nodes_expanded, max_queue_size, np.empty(0, dtype=np.int64)
+
+
+def numba_graph_search(problem, heuristic_func=None):
+    """
+    Drop-in replacement for graph_search() that runs the search in astar().
+    Only the built-in heuristics are supported.
+    
+    Returns:
+        tuple: (goal_node, nodes_expanded, max_queue_size)
+    """
+    if heuristic_func is None:
+        heuristic_func = uniform_cost
+    if heuristic_func not in HEURISTIC_IDS:
+        raise ValueError(f"No Numba implementation for heuristic {heuristic_func.__name__}")
+    
+    found, nodes_expanded, max_queue_size, path = astar(
+        problem.initial_state, problem.goal_state, HEURISTIC_IDS[heuristic_func]
+    )
+    if not found:
+        return None, nodes_expanded, max_queue_size
+    
+    trail = []
+    for i, state in enumerate(path.tolist()):
+        trail.append((state, problem._find_blank(state), i - 1 if i else None))
+    goal_node = _build_solution(trail, len(trail) - 1, heuristic_func)
+    return goal_node, nodes_expanded, max_queue_size
+
+
+# Compile (or load from cache) at import so the first search is not charged for it
+astar(GOAL_INT, GOAL_INT, UNIFORM_COST)
@@ -13,7 +13,9 @@ Install: pip install matplotlib
 """
 
 import time
-from eight_puzzle import Problem, Heuristic, graph_search
+from functools import lru_cache
+from multiprocessing import Pool, cpu_count
+from eight_puzzle import Problem, Heuristic, encode, graph_search, is_solvable
 
 # Test cases from project requirements
 test_cases = {
@@ -33,38 +35,87 @@ algorithms = {
 }
 
 
-def run_all_tests():
-    """Run all test cases with all algorithms."""
+@lru_cache(maxsize=None)
+def _is_solvable_cached(state):
+    """Cached solvability check on an encoded state, without building a Problem."""
+    return is_solvable(state)
+
+
+# Results of earlier searches in this process, keyed by (encoded state, algorithm
+# name). Kept in the parent, since pool workers do not outlive a run; each row
+# keeps the time its original search took
+_solved = {}
+
+
+def _run_one(job):
+    """Worker for run_all_tests(): solve one (algorithm, state) job."""
+    algo_name, state = job
+    start_time = time.time()
+    goal_node, nodes_expanded, max_queue_size = graph_search(Problem(state), algorithms[algo_name])
+    elapsed_time = time.time() - start_time
+    
+    # Return plain values; the Node chain is not worth pickling back
+    if goal_node is None:
+        return job, None
+    return job, {
+        'depth': goal_node.g,
+        'nodes': nodes_expanded,
+        'max_queue': max_queue_size,
+        'time': elapsed_time
+    }
+
+
+def run_all_tests(processes=None):
+    """
+    Run all test cases with all algorithms.
+    Searches already in _solved are reused; the rest are independent, so
+    they run in a process pool with `processes` workers (default: one per
+    core, at most one per search).
+    """
     results = {}
+    cases = {}
     
     print("Running comprehensive tests...")
     print("="*80)
     
     for test_name, initial_state in test_cases.items():
-        print(f"\nTesting: {test_name}")
-        problem = Problem(initial_state)
+        state = encode(initial_state)
         
         # Check solvability
-        if not problem.is_solvable(initial_state):
-            print(f"  {test_name}: IMPOSSIBLE")
+        if not _is_solvable_cached(state):
             results[test_name] = None
             continue
         
         results[test_name] = {}
+        cases[test_name] = state
+    
+    # Jobs carry the algorithm name, not the heuristic function, so they pickle anywhere
+    jobs = list(dict.fromkeys(
+        (algo_name, state) for state in cases.values() for algo_name in algorithms
+        if (algo_name, state) not in _solved
+    ))
+    if jobs:
+        if processes is None:
+            processes = min(len(jobs), cpu_count())
+        with Pool(processes) as pool:
+            for job, row in pool.imap_unordered(_run_one, jobs):
+                _solved[job] = row
+    
+    # Report in test case and algorithm order, whatever order the jobs finished in
+    for test_name, state in cases.items():
+        for algo_name in algorithms:
+            row = _solved[algo_name, state]
+            if row is not None:
+                results[test_name][algo_name] = dict(row)  # A copy, so callers cannot edit _solved
+    
+    for test_name, test_results in results.items():
+        print(f"\nTesting: {test_name}")
+        if test_results is None:
+            print(f"  {test_name}: IMPOSSIBLE")
+            continue
         
-        for algo_name, heuristic_func in algorithms.items():
-            start_time = time.time()
-            goal_node, nodes_expanded, max_queue_size = graph_search(problem, heuristic_func)
-            elapsed_time = time.time() - start_time
-            
-            if goal_node:
-                results[test_name][algo_name] = {
-                    'depth': goal_node.g,
-                    'nodes': nodes_expanded,
-                    'max_queue': max_queue_size,
-                    'time': elapsed_time
-                }
-                print(f"  {algo_name:25s}: Depth={goal_node.g:2d}, Nodes={nodes_expanded:6d}, MaxQ={max_queue_size:6d}")
+        for algo_name, row in test_results.items():
+            print(f"  {algo_name:25s}: Depth={row['depth']:2d}, Nodes={row['nodes']:6d}, MaxQ={row['max_queue']:6d}")
     
     return results
 
@@ -87,9 +138,9 @@ def print_tables(results):
     for test_name in solvable_cases.keys():
         row = f"{test_name:15s}"
         for algo_name in algorithms.keys():
-            if algo_name in solvable_cases[test_name]:
-                nodes = solvable_cases[test_name][algo_name]['nodes']
-                row += f"{nodes:>22d}"
+            entry = solvable_cases[test_name].get(algo_name)
+            if entry:
+                row += f"{entry['nodes']:>22d}"
             else:
                 row += f"{'N/A':>22s}"
         print(row)
@@ -104,9 +155,9 @@ def print_tables(results):
     for test_name in solvable_cases.keys():
         row = f"{test_name:15s}"
         for algo_name in algorithms.keys():
-            if algo_name in solvable_cases[test_name]:
-                max_q = solvable_cases[test_name][algo_name]['max_queue']
-                row += f"{max_q:>22d}"
+            entry = solvable_cases[test_name].get(algo_name)
+            if entry:
+                row += f"{entry['max_queue']:>22d}"
             else:
                 row += f"{'N/A':>22s}"
         print(row)
@@ -138,9 +189,10 @@ def generate_charts(results):
     
     for test_name in test_names:
         for algo_name in algo_names:
-            if algo_name in solvable_cases[test_name]:
-                nodes_data[algo_name].append(solvable_cases[test_name][algo_name]['nodes'])
-                queue_data[algo_name].append(solvable_cases[test_name][algo_name]['max_queue'])
+            entry = solvable_cases[test_name].get(algo_name)
+            if entry:
+                nodes_data[algo_name].append(entry['nodes'])
+                queue_data[algo_name].append(entry['max_queue'])
             else:
                 nodes_data[algo_name].append(0)
                 queue_data[algo_name].append(0)
@@ -225,8 +277,9 @@ def generate_charts(results):
     for test_name in test_names:
         row = [test_name]
         for algo_name in algo_names:
-            if algo_name in solvable_cases[test_name]:
-                row.append(str(solvable_cases[test_name][algo_name]['nodes']))
+            entry = solvable_cases[test_name].get(algo_name)
+            if entry:
+                row.append(str(entry['nodes']))
             else:
                 row.append('N/A')
         table_data.append(row)
@@ -7,16 +7,38 @@ Usage:
     python run_tests.py --trace      # Run required trace for submission
     python run_tests.py --verbose    # Run all tests with detailed output
     python run_tests.py --quick      # Quick test with Manhattan Distance only
+    python run_tests.py --depth-only # Solution depths only, one search per puzzle
+    python run_tests.py --jobs 4     # Run the test matrix on 4 worker processes
+    python run_tests.py --no-boards  # Skip printing each puzzle's board
+    python run_tests.py --json out.ndjson  # Also write one JSON line per result
 """
 
 import sys
 import io
+import json
+import os
 import time
+from collections import deque
+from functools import lru_cache
+from multiprocessing import Pool
 
-from eight_puzzle import Problem, Heuristic, graph_search, print_state
+from eight_puzzle import (
+    GOAL_STATE, Problem, Heuristic, encode, format_state, graph_search, is_solvable, print_state,
+)
 
-# Test cases from project document
-test_cases = {
+try:
+    import orjson  # Optional, faster serializer for --json
+except ImportError:
+    orjson = None
+
+# Set UTF-8 encoding for Windows console, once per process; a stream that is
+# already UTF-8 is not wrapped again
+if sys.platform == 'win32' and (getattr(sys.stdout, 'encoding', None) or '').lower() != 'utf-8':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# Test cases from project document, as 3x3 boards
+_LEGACY_CASES = {
     "Trivial": [[1, 2, 3], [4, 5, 6], [7, 8, 0]],
     "Very Easy": [[1, 2, 3], [4, 5, 6], [7, 0, 8]],
     "Easy": [[1, 2, 0], [4, 5, 3], [7, 8, 6]],
@@ -25,17 +47,22 @@ test_cases = {
     "Impossible": [[1, 2, 3], [4, 5, 6], [8, 7, 0]],
 }
 
+# The same cases pre-encoded, the form Problem and the search use internally
+test_cases = {name: encode(board) for name, board in _LEGACY_CASES.items()}
+
 # Additional challenging test cases
-extra_test_cases = {
+_LEGACY_EXTRA_CASES = {
     "Medium": [[1, 3, 0], [4, 2, 6], [7, 5, 8]],
     "Hard": [[2, 8, 1], [0, 4, 3], [7, 6, 5]],
     "Very Hard": [[5, 6, 7], [4, 0, 8], [3, 2, 1]],
 }
+extra_test_cases = {name: encode(board) for name, board in _LEGACY_EXTRA_CASES.items()}
 
 # Required trace puzzle
-required_trace = {
+_LEGACY_TRACE = {
     "Required Trace": [[1, 0, 3], [4, 2, 6], [7, 5, 8]]
 }
+required_trace = {name: encode(board) for name, board in _LEGACY_TRACE.items()}
 
 # All available algorithms
 algorithms = {
@@ -45,9 +72,27 @@ algorithms = {
     "Manhattan Distance": Heuristic.manhattan_distance,
 }
 
+# Puzzles with a Manhattan distance below this run in-process even with --jobs
+_INLINE_BELOW = 8
+
+# Column titles for the comparison tables, computed once
+_SHORT_NAMES = tuple(a.replace(" Search", "").replace(" Distance", "") for a in algorithms)
+_HEADER = f"{'Puzzle':<15s}" + "".join(f"{n:>20s}" for n in _SHORT_NAMES)
+
+
+# Monotonic, high-resolution clock for search timing, in integer nanoseconds
+_now = time.perf_counter_ns
+
+
+def emit(lines):
+    """Write a block of output lines with a single write to stdout."""
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.write("\n")
 
-def format_time(seconds):
-    """Format time in human-readable format."""
+
+def format_time(value):
+    """Format a duration (int nanoseconds or float seconds) in human-readable format."""
+    seconds = value / 1e9 if isinstance(value, int) else value
     if seconds < 0.001:
         return f"{seconds*1000000:.0f}µs"
     elif seconds < 1:
@@ -56,27 +101,43 @@ def format_time(seconds):
         return f"{seconds:.2f}s"
 
 
-def run_test(name, initial_state, heuristic_name, heuristic_func, verbose=False):
-    """Run a single test case and return performance metrics."""
-    problem = Problem(initial_state)
-    
-    # Check if solvable
-    if not problem.is_solvable(initial_state):
-        if verbose:
-            print(f"  {heuristic_name}: IMPOSSIBLE (not solvable)")
-        return None
-    
+@lru_cache(maxsize=None)
+def _is_solvable_cached(state):
+    """
+    Memoized is_solvable on an encoded state, shared by every harness run in
+    the process. Call it before building a Problem for the puzzle, so
+    unsolvable boards never get one.
+    """
+    return is_solvable(state)
+
+
+def _warm_up():
+    """
+    Run every algorithm once on a one-move puzzle and discard the result, so
+    one-off costs (imports, caches, JIT compilation in an accelerated
+    backend) are not charged to the first timed search.
+    """
+    problem = Problem(test_cases["Very Easy"])
+    for heuristic_func in algorithms.values():
+        graph_search(problem, heuristic_func)
+
+
+def run_test(name, problem, heuristic_name, heuristic_func, verbose=False):
+    """
+    Run a single test case and return performance metrics.
+    The caller builds the Problem and checks it is solvable, once per puzzle.
+    """
     if verbose:
         print(f"\n{'='*60}")
         print(f"Testing: {name} with {heuristic_name}")
         print(f"{'='*60}")
-        print_state("Initial State:", initial_state)
+        print_state("Initial State:", problem.initial_state)
         print()
     
     # Run the search and measure time
-    start_time = time.time()
+    t0 = _now()
     goal_node, nodes_expanded, max_queue_size = graph_search(problem, heuristic_func)
-    elapsed_time = time.time() - start_time
+    elapsed_ns = _now() - t0
     
     if goal_node:
         depth = goal_node.g
@@ -85,12 +146,12 @@ def run_test(name, initial_state, heuristic_name, heuristic_func, verbose=False)
             print(f"Solution depth: {depth}")
             print(f"Nodes expanded: {nodes_expanded}")
             print(f"Max queue size: {max_queue_size}")
-            print(f"Time: {format_time(elapsed_time)}")
+            print(f"Time: {format_time(elapsed_ns)}")
         return {
             'nodes_expanded': nodes_expanded,
             'max_queue_size': max_queue_size,
             'depth': depth,
-            'time': elapsed_time,
+            'time_ns': elapsed_ns,
             'solved': True
         }
     else:
@@ -100,40 +161,77 @@ def run_test(name, initial_state, heuristic_name, heuristic_func, verbose=False)
             'nodes_expanded': nodes_expanded,
             'max_queue_size': max_queue_size,
             'depth': -1,
-            'time': elapsed_time,
+            'time_ns': elapsed_ns,
             'solved': False
         }
 
 
-def run_all_tests(verbose=False, include_extra=False):
-    """Run all test cases with all algorithms."""
+def _worker(name, problem, algo_name):
+    """Pool worker: run one (puzzle, algorithm) job, looking the heuristic up by name."""
+    return name, algo_name, run_test(name, problem, algo_name, algorithms[algo_name])
+
+
+def run_all_tests(verbose=False, include_extra=False, jobs=1, show_boards=True):
+    """
+    Run all test cases with all algorithms.
+    With jobs > 1 the searches run up front on a pool of that many worker
+    processes; verbose output needs the searches in-process, so it runs serially.
+    show_boards=False leaves out the board printed above each puzzle's results.
+    """
     print("\n" + "="*80)
     print("COMPREHENSIVE TEST RESULTS")
     print("="*80)
     
+    _warm_up()
     results = {}
     all_cases = dict(test_cases)
     if include_extra:
         all_cases.update(extra_test_cases)
     
+    # Check solvability once per puzzle, and only build Problems for the solvable ones
+    solvable = {name: _is_solvable_cached(encode(state)) for name, state in all_cases.items()}
+    problems = {name: Problem(state) for name, state in all_cases.items() if solvable[name]}
+    
+    # Every (puzzle, algorithm) search is independent, so farm them out. Puzzles
+    # estimated cheap by their Manhattan distance stay in-process, where they
+    # finish faster than a round trip to a worker
+    precomputed = {}
+    if jobs > 1 and not verbose:
+        work = [
+            (name, problem, algo_name)
+            for name, problem in problems.items()
+            if Heuristic.manhattan_distance(problem.initial_state) >= _INLINE_BELOW
+            for algo_name in algorithms
+        ]
+    else:
+        work = []
+    if work:
+        # Each worker warms up on its own, as the parent's warm-up does not carry over
+        with Pool(min(jobs, len(work)), initializer=_warm_up) as pool:
+            for name, algo_name, result in pool.starmap(_worker, work):
+                precomputed[name, algo_name] = result
+    
     for test_name, initial_state in all_cases.items():
         print(f"\n{test_name}:")
-        print_state("", initial_state)
+        if show_boards:
+            print_state("", initial_state)
         
         # Check solvability first
-        problem = Problem(initial_state)
-        if not problem.is_solvable(initial_state):
+        if not solvable[test_name]:
             print("  STATUS: ❌ IMPOSSIBLE (This puzzle cannot be solved)")
             continue
+        problem = problems[test_name]
         
         print("  STATUS: ✓ Solvable")
         results[test_name] = {}
         
         for algo_name, heuristic_func in algorithms.items():
-            result = run_test(test_name, initial_state, algo_name, heuristic_func, verbose=verbose)
+            result = precomputed.get((test_name, algo_name))
+            if result is None:
+                result = run_test(test_name, problem, algo_name, heuristic_func, verbose=verbose)
             if result:
                 results[test_name][algo_name] = result
-                time_str = format_time(result['time'])
+                time_str = format_time(result['time_ns'])
                 print(f"  {algo_name:25s}: Depth={result['depth']:2d}, "
                       f"Nodes={result['nodes_expanded']:6d}, "
                       f"MaxQ={result['max_queue_size']:6d}, "
@@ -142,93 +240,82 @@ def run_all_tests(verbose=False, include_extra=False):
     return results
 
 
+def write_json(results, path):
+    """Write results as NDJSON: one {puzzle, algo, depth, nodes, maxq, time_ns} object per line."""
+    with open(path, "wb") as out:
+        for test_name, test_results in results.items():
+            for algo_name, r in test_results.items():
+                record = {
+                    "puzzle": test_name,
+                    "algo": algo_name,
+                    "depth": r['depth'],
+                    "nodes": r['nodes_expanded'],
+                    "maxq": r['max_queue_size'],
+                    "time_ns": r['time_ns'],
+                }
+                if orjson is not None:
+                    out.write(orjson.dumps(record) + b"\n")
+                else:
+                    out.write(json.dumps(record, separators=(",", ":")).encode() + b"\n")
+
+
 def print_comparison_table(results):
     """Print a detailed comparison table of all results."""
     if not results:
         print("\nNo results to display!")
         return
     
-    # Nodes Expanded Table
-    print("\n" + "="*100)
-    print("COMPARISON TABLE: Number of Nodes Expanded")
-    print("="*100)
-    
-    header = f"{'Puzzle':<15s}"
-    for algo_name in algorithms.keys():
-        short_name = algo_name.replace(" Search", "").replace(" Distance", "")
-        header += f"{short_name:>20s}"
-    print(header)
-    print("-"*100)
-    
-    for test_name in results.keys():
-        row = f"{test_name:<15s}"
-        for algo_name in algorithms.keys():
-            if algo_name in results[test_name]:
-                nodes = results[test_name][algo_name]['nodes_expanded']
-                row += f"{nodes:>20d}"
-            else:
-                row += f"{'N/A':>20s}"
-        print(row)
-    
-    # Maximum Queue Size Table
-    print("\n" + "="*100)
-    print("COMPARISON TABLE: Maximum Queue Size")
-    print("="*100)
-    print(header)
-    print("-"*100)
-    
-    for test_name in results.keys():
-        row = f"{test_name:<15s}"
-        for algo_name in algorithms.keys():
-            if algo_name in results[test_name]:
-                queue = results[test_name][algo_name]['max_queue_size']
-                row += f"{queue:>20d}"
-            else:
-                row += f"{'N/A':>20s}"
-        print(row)
-    
-    # Execution Time Table
-    print("\n" + "="*100)
-    print("COMPARISON TABLE: Execution Time")
-    print("="*100)
-    print(header)
-    print("-"*100)
-    
-    for test_name in results.keys():
-        row = f"{test_name:<15s}"
-        for algo_name in algorithms.keys():
-            if algo_name in results[test_name]:
-                time_val = results[test_name][algo_name]['time']
-                row += f"{format_time(time_val):>20s}"
-            else:
-                row += f"{'N/A':>20s}"
-        print(row)
+    # One pass over results fills the rows of all three tables and the totals
+    # behind the performance summary
+    nodes_lines, queue_lines, time_lines = [_HEADER], [_HEADER], [_HEADER]
+    totals = {algo_name: [0, 0, 0, 0] for algo_name in algorithms}  # nodes, queue, time_ns, count
+    
+    for test_name, test_results in results.items():
+        nodes_row = queue_row = time_row = f"{test_name:<15s}"
+        for algo_name in algorithms:
+            r = test_results.get(algo_name)
+            if r is None:
+                nodes_row += f"{'N/A':>20s}"
+                queue_row += f"{'N/A':>20s}"
+                time_row += f"{'N/A':>20s}"
+                continue
+            nodes_row += f"{r['nodes_expanded']:>20d}"
+            queue_row += f"{r['max_queue_size']:>20d}"
+            time_row += f"{format_time(r['time_ns']):>20s}"
+            
+            total = totals[algo_name]
+            total[0] += r['nodes_expanded']
+            total[1] += r['max_queue_size']
+            total[2] += r['time_ns']
+            total[3] += 1
+        nodes_lines.append(nodes_row)
+        queue_lines.append(queue_row)
+        time_lines.append(time_row)
+    
+    # Nodes Expanded, Maximum Queue Size and Execution Time tables
+    lines = []
+    for title, table_lines in (
+        ("Number of Nodes Expanded", nodes_lines),
+        ("Maximum Queue Size", queue_lines),
+        ("Execution Time", time_lines),
+    ):
+        lines += ["", "="*100, f"COMPARISON TABLE: {title}", "="*100, table_lines[0], "-"*100]
+        lines += table_lines[1:]
     
     # Performance Summary
-    print("\n" + "="*100)
-    print("PERFORMANCE SUMMARY (Average across all solvable puzzles)")
-    print("="*100)
-    print(f"{'Algorithm':<25s} {'Avg Nodes':>12s} {'Avg MaxQ':>12s} {'Avg Time':>12s}")
-    print("-"*100)
+    lines += [
+        "", "="*100, "PERFORMANCE SUMMARY (Average across all solvable puzzles)", "="*100,
+        f"{'Algorithm':<25s} {'Avg Nodes':>12s} {'Avg MaxQ':>12s} {'Avg Time':>12s}", "-"*100,
+    ]
     
-    for algo_name in algorithms.keys():
-        total_nodes = 0
-        total_queue = 0
-        total_time = 0.0
-        count = 0
-        
-        for test_name in results.keys():
-            if algo_name in results[test_name]:
-                total_nodes += results[test_name][algo_name]['nodes_expanded']
-                total_queue += results[test_name][algo_name]['max_queue_size']
-                total_time += results[test_name][algo_name]['time']
-                count += 1
-        
+    for algo_name, (total_nodes, total_queue, total_time_ns, count) in totals.items():
         if count > 0:
             avg_nodes = total_nodes / count
             avg_queue = total_queue / count
-            avg_time = total_time / count
-            print(f"{algo_name:<25s} {avg_nodes:>12.1f} {avg_queue:>12.1f} {format_time(avg_time):>12s}")
+            avg_time_ns = total_time_ns // count
+            lines.append(f"{algo_name:<25s} {avg_nodes:>12.1f} {avg_queue:>12.1f} {format_time(avg_time_ns):>12s}")
+    
+    emit(lines)
 
 
 def test_required_trace():
@@ -238,28 +325,28 @@ def test_required_trace():
     print("Using Euclidean Distance Heuristic")
     print("="*80)
     
+    _warm_up()
     name, initial_state = list(required_trace.items())[0]
     print_state("\nInitial State:", initial_state)
     print("\nTarget Goal State:")
-    goal = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
-    print_state("", goal)
+    print_state("", GOAL_STATE)
     
     # Check solvability
-    problem = Problem(initial_state)
-    if not problem.is_solvable(initial_state):
+    if not _is_solvable_cached(encode(initial_state)):
         print("\n❌ This puzzle is not solvable!")
         return
+    problem = Problem(initial_state)
     
     print("\n✓ Puzzle is solvable")
     print("\n" + "-"*80)
     print("RUNNING SEARCH...")
     print("-"*80 + "\n")
     
-    start_time = time.time()
+    t0 = _now()
     goal_node, nodes_expanded, max_queue_size = graph_search(
         problem, Heuristic.euclidean_distance
     )
-    elapsed_time = time.time() - start_time
+    elapsed_ns = _now() - t0
     
     if goal_node:
         print("\n" + "="*80)
@@ -268,72 +355,74 @@ def test_required_trace():
         print(f"\nSolution depth:      {goal_node.g}")
         print(f"Nodes expanded:      {nodes_expanded}")
         print(f"Maximum queue size:  {max_queue_size}")
-        print(f"Execution time:      {format_time(elapsed_time)}")
+        print(f"Execution time:      {format_time(elapsed_ns)}")
         
         # Print solution path
         print("\n" + "-"*80)
         print("Solution path (sequence of moves):")
         print("-"*80)
         current = goal_node
-        actions = []
+        actions = deque()
         while current.parent:
-            actions.append(current.action)
+            actions.appendleft(current.action)
             current = current.parent
-        actions.reverse()
         print(" → ".join(actions))
         
         # Print step-by-step solution
         print("\n" + "-"*80)
         print("Step-by-step solution:")
         print("-"*80)
-        states = []
+        states = deque()
         current = goal_node
         while current:
-            states.append((current.action, current.state))
+            states.appendleft((current.action, current.state))
             current = current.parent
-        states.reverse()
         
+        lines = []
         for i, (action, state) in enumerate(states):
             if action is None:
-                print(f"\nStep 0: Initial State")
+                lines += ["", "Step 0: Initial State"]
             else:
-                print(f"\nStep {i}: Move blank {action}")
-            print_state("", state)
+                lines += ["", f"Step {i}: Move blank {action}"]
+            lines += format_state(state)
+        emit(lines)
     else:
         print("\n❌ No solution found!")
 
 
-def quick_test():
+def quick_test(show_boards=True):
     """Quick test with Manhattan Distance only (fastest heuristic)."""
     print("\n" + "="*80)
     print("QUICK TEST - Manhattan Distance Heuristic Only")
     print("="*80)
     
+    _warm_up()
     results = {}
     
     for test_name, initial_state in test_cases.items():
         print(f"\n{test_name}:")
-        print_state("", initial_state)
+        if show_boards:
+            print_state("", initial_state)
         
-        problem = Problem(initial_state)
-        if not problem.is_solvable(initial_state):
+        if not _is_solvable_cached(encode(initial_state)):
             print("  ❌ IMPOSSIBLE")
             continue
+        problem = Problem(initial_state)
         
-        start_time = time.time()
+        t0 = _now()
         goal_node, nodes_expanded, max_queue_size = graph_search(
             problem, Heuristic.manhattan_distance
         )
-        elapsed_time = time.time() - start_time
+        elapsed_ns = _now() - t0
         
         if goal_node:
             print(f"  ✓ Depth={goal_node.g}, Nodes={nodes_expanded}, "
-                  f"MaxQ={max_queue_size}, Time={format_time(elapsed_time)}")
+                  f"MaxQ={max_queue_size}, Time={format_time(elapsed_ns)}")
             results[test_name] = {
                 'depth': goal_node.g,
                 'nodes': nodes_expanded,
                 'max_q': max_queue_size,
-                'time': elapsed_time
+                'time_ns': elapsed_ns
             }
         else:
             print(f"  ❌ No solution found")
@@ -341,6 +430,33 @@ def quick_test():
     return results
 
 
+def depth_only_test(show_boards=True):
+    """
+    Report each puzzle's solution depth for every algorithm from a single
+    Manhattan Distance search. All the algorithms are optimal, so they share
+    that depth; nodes expanded and queue sizes need a real per-heuristic
+    run and are not reported.
+    """
+    print("\n" + "="*80)
+    print("DEPTH-ONLY TEST - one Manhattan Distance search per puzzle")
+    print("="*80)
+    
+    _warm_up()
+    boards = []
+    lines = ["", "="*100, "Solution Depth (shared by all algorithms)", "="*100, _HEADER, "-"*100]
+    for test_name, initial_state in test_cases.items():
+        if show_boards:
+            boards += ["", f"{test_name}:"] + format_state(initial_state)
+        
+        if not _is_solvable_cached(encode(initial_state)):
+            cell = f"{'IMPOSSIBLE':>20s}"
+        else:
+            goal_node, _, _ = graph_search(Problem(initial_state), Heuristic.manhattan_distance)
+            cell = f"{goal_node.g:>20d}" if goal_node else f"{'N/A':>20s}"
+        lines.append(f"{test_name:<15s}" + cell * len(algorithms))
+    emit(boards + lines)
+
+
 def test_solvability():
     """Test the solvability checker with known solvable and unsolvable puzzles."""
     print("\n" + "="*80)
@@ -362,21 +478,19 @@ def test_solvability():
     print("-" * 80)
     all_correct = True
     for name, state in solvable_puzzles:
-        problem = Problem(state)
-        is_solvable = problem.is_solvable(state)
-        status = "✓ PASS" if is_solvable else "❌ FAIL"
-        print(f"{name:15s}: {status} (is_solvable={is_solvable})")
-        if not is_solvable:
+        solvable = _is_solvable_cached(encode(state))
+        status = "✓ PASS" if solvable else "❌ FAIL"
+        print(f"{name:15s}: {status} (is_solvable={solvable})")
+        if not solvable:
             all_correct = False
     
     print("\nTesting unsolvable puzzles (should all return False):")
     print("-" * 80)
     for name, state in unsolvable_puzzles:
-        problem = Problem(state)
-        is_solvable = problem.is_solvable(state)
-        status = "✓ PASS" if not is_solvable else "❌ FAIL"
-        print(f"{name:15s}: {status} (is_solvable={is_solvable})")
-        if is_solvable:
+        solvable = _is_solvable_cached(encode(state))
+        status = "✓ PASS" if not solvable else "❌ FAIL"
+        print(f"{name:15s}: {status} (is_solvable={solvable})")
+        if solvable:
             all_correct = False
     
     print("\n" + "="*80)
@@ -389,16 +503,36 @@ def test_solvability():
 
 def main():
     """Main entry point for the test suite."""
-    import sys
-    
-    # Set UTF-8 encoding for Windows console
-    if sys.platform == 'win32':
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-    
-    # Parse command line arguments
-    if len(sys.argv) > 1:
-        arg = sys.argv[1].lower()
+    # Parse command line arguments; --jobs N, --no-boards and --json PATH may accompany any option
+    args = sys.argv[1:]
+    show_boards = "--no-boards" not in args
+    if not show_boards:
+        args.remove("--no-boards")
+    json_path = None
+    if "--json" in args:
+        i = args.index("--json")
+        if i + 1 >= len(args):
+            print("\n--json needs an output path, e.g. --json results.ndjson\n")
+            return
+        json_path = args[i + 1]
+        del args[i:i + 2]
+    jobs = os.cpu_count() or 1
+    if "--jobs" in args:
+        i = args.index("--jobs")
+        try:
+            jobs = max(1, int(args[i + 1]))
+        except (IndexError, ValueError):
+            print("\n--jobs needs a number of worker processes, e.g. --jobs 4\n")
+            return
+        del args[i:i + 2]
+    
+    if args:
+        arg = args[0].lower()
+        
+        # These modes produce no per-algorithm results to write
+        if json_path and arg in ("--trace", "--depth-only", "--solvability"):
+            print(f"\n--json is not supported with {args[0]}\n")
+            return
         
         if arg == "--trace":
             # Run required trace for submission
@@ -406,12 +540,28 @@ def main():
         
         elif arg == "--verbose":
             # Run all tests with detailed output
-            results = run_all_tests(verbose=True)
+            results = run_all_tests(verbose=True, show_boards=show_boards)
             print_comparison_table(results)
+            if json_path:
+                write_json(results, json_path)
         
         elif arg == "--quick":
             # Quick test with Manhattan Distance only
-            quick_test()
+            results = quick_test(show_boards=show_boards)
+            if json_path:
+                write_json({
+                    test_name: {"Manhattan Distance": {
+                        'depth': r['depth'],
+                        'nodes_expanded': r['nodes'],
+                        'max_queue_size': r['max_q'],
+                        'time_ns': r['time_ns'],
+                    }}
+                    for test_name, r in results.items()
+                }, json_path)
+        
+        elif arg == "--depth-only":
+            # Depths only, from one Manhattan Distance search per puzzle
+            depth_only_test(show_boards=show_boards)
         
         elif arg == "--solvability":
             # Test solvability checker
@@ -419,8 +569,10 @@ def main():
         
         elif arg == "--extra":
             # Run all tests including extra challenging cases
-            results = run_all_tests(verbose=False, include_extra=True)
+            results = run_all_tests(verbose=False, include_extra=True, jobs=jobs, show_boards=show_boards)
             print_comparison_table(results)
+            if json_path:
+                write_json(results, json_path)
         
         elif arg == "--help" or arg == "-h":
             print("\n" + "="*80)
@@ -433,16 +585,23 @@ def main():
             print("  --verbose       Run all tests with detailed output")
             print("  --quick         Quick test with Manhattan Distance only (fastest)")
             print("  --extra         Include extra challenging test cases")
+            print("  --depth-only    Solution depths only: one Manhattan search per puzzle,")
+            print("                  copied to every algorithm (no nodes or queue sizes)")
             print("  --solvability   Test the solvability checker")
+            print("  --jobs N        Run the test matrix on N processes (default: one per core)")
+            print("  --no-boards     Don't print each puzzle's board above its results")
+            print("  --json PATH     Also write the results to PATH, one JSON object per line")
+            print("                  (not with --trace, --depth-only or --solvability)")
             print("  --help, -h      Show this help message")
             print("\nExamples:")
             print("  python run_tests.py")
             print("  python run_tests.py --trace")
             print("  python run_tests.py --quick")
+            print("  python run_tests.py --extra --jobs 4")
             print("="*80 + "\n")
         
         else:
-            print(f"\nUnknown option: {sys.argv[1]}")
+            print(f"\nUnknown option: {args[0]}")
             print("Use --help or -h to see available options.\n")
     
     else:
@@ -453,8 +612,10 @@ def main():
         print("\nRunning all standard test cases with all algorithms...")
         print("(Use --help to see more options)")
         
-        results = run_all_tests(verbose=False)
+        results = run_all_tests(verbose=False, jobs=jobs, show_boards=show_boards)
         print_comparison_table(results)
+        if json_path:
+            write_json(results, json_path)
         
         print("\n" + "="*80)
         print("Test suite completed!")
@@ -464,7 +625,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
-
-
-